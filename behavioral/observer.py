@@ -44,7 +44,28 @@ changes state, all its dependents are notified and update automatically.
 # The following program demonstrates how subject and observers can sync therir state using
 # Observer design pattern.
 
-import abc
+import asyncio
+import contextlib
+import contextvars
+import inspect
+import threading
+import weakref
+
+# Value delivered by the running notification. A context variable rather than a
+# thread-local so async observers, which run as tasks, see their own notification's value.
+_SNAPSHOT = contextvars.ContextVar('subject_state_snapshot', default=None)
+
+# Subject whose (sync) notification is running on this thread. When an observer is
+# registered with several subjects, push() goes back to the one notifying it.
+_CURRENT_SUBJECT = threading.local()
+
+
+def _make_prune_callback(subject_ref):
+    def prune(_dead_ref):
+        subject = subject_ref()
+        if subject is not None:
+            subject._prune()
+    return prune
 
 
 class Subject:
@@ -54,42 +75,238 @@ class Subject:
     """
     def __init__(self):
         self._subject_state = None
-        self._observers = set()
+        # Copy-on-write: register/de_register build new tuples under the lock and rebind
+        # them, so the notify loops read a consistent snapshot without locking.
+        # Observers are held weakly: _observers holds weakref.ref and the callable tuples
+        # hold weakref.WeakMethod of the pre-bound update, so an observer that is dropped
+        # without de_register is pruned instead of leaking. Reentrant because the
+        # pruning callback may run from garbage collection inside register/de_register.
+        self._observers_lock = threading.RLock()
+        # weakref callback that prunes dead observers; it reaches the subject through a
+        # weak reference so the callbacks held in _observers do not keep the subject alive
+        self._prune_callback = _make_prune_callback(weakref.ref(self))
+        self._observers = ()
+        self._cached_callables = ()
+        # update coroutine functions of observers declaring ``async def update``
+        self._async_callables = ()
+        # last scheduled async delivery; each new one waits for it so values arrive in order
+        self._async_task = None
+        # per-thread list of values buffered by batch(), None outside a batch
+        self._batch = threading.local()
     
     def _notify(self, arg):
-        for observer in self._observers:
-            observer.update(arg)
+        self._call_observers(arg)
+    
+    def _notify_batch(self, args):
+        self._call_observers(args)
+    
+    def _call_observers(self, arg):
+        token = _SNAPSHOT.set(arg)
+        previous = getattr(_CURRENT_SUBJECT, 'value', None)
+        _CURRENT_SUBJECT.value = self
+        try:
+            for update_ref in self._cached_callables:
+                update = update_ref()
+                if update is not None:
+                    update(arg)
+        finally:
+            _CURRENT_SUBJECT.value = previous
+            _SNAPSHOT.reset(token)
+        if self._async_callables:
+            self._schedule_async(arg)
+    
+    async def _notify_async(self, arg):
+        # runs in its own task context, which the gathered observer tasks copy
+        _SNAPSHOT.set(arg)
+        updates = [update_ref() for update_ref in self._async_callables]
+        results = await asyncio.gather(
+            *(update(arg) for update in updates if update is not None),
+            return_exceptions=True)
+        return [result for result in results if isinstance(result, BaseException)]
+    
+    async def _notify_async_after(self, previous, arg):
+        if previous is not None:
+            await asyncio.wait([previous])
+        return await self._notify_async(arg)
+    
+    def _schedule_async(self, arg):
+        """
+        Await the async observers concurrently, after the previous async delivery of
+        this subject has finished, so observers see values in assignment order.
+        Errors raised by observers are reported to the loop's exception handler.
+        """
+        loop = asyncio.get_running_loop()
+        previous = self._async_task
+        if previous is not None and (previous.done() or previous.get_loop() is not loop):
+            previous = None
+        task = loop.create_task(self._notify_async_after(previous, arg))
+        self._async_task = task
+        task.add_done_callback(self._async_done)
+    
+    def _async_done(self, task):
+        if self._async_task is task:
+            self._async_task = None
+        if task.cancelled():
+            return
+        errors = [task.exception()] if task.exception() else task.result()
+        for error in errors:
+            task.get_loop().call_exception_handler({
+                'message': 'async observer update failed',
+                'exception': error,
+                'task': task,
+            })
+    
+    async def wait_async(self):
+        """
+        Wait until the async observers have received every value assigned so far.
+        """
+        task = self._async_task
+        if task is not None:
+            await asyncio.wait([task])
+    
+    def _check_async_loop(self):
+        if self._async_callables:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                raise RuntimeError("a subject with async observers must be updated from "
+                                   "a running event loop") from None
+    
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        Buffer state changes made by this thread inside the block and send observers a
+        single notification carrying the list of buffered values when the outermost
+        block exits. Other threads keep notifying immediately.
+        
+        If a block raises, the values it buffered are dropped and subject_state is rolled
+        back, unless another thread has assigned it since; values buffered by enclosing
+        blocks are kept.
+        """
+        pending = getattr(self._batch, 'pending', None)
+        outermost = pending is None
+        if outermost:
+            pending = self._batch.pending = []
+        mark = len(pending)
+        state_before = self._subject_state
+        try:
+            yield self
+        except BaseException:
+            written = pending[mark:]
+            del pending[mark:]
+            if written and self._subject_state is written[-1]:
+                self._subject_state = state_before
+            if outermost:
+                self._batch.pending = None
+            raise
+        if outermost:
+            self._batch.pending = None
+            if pending:
+                self._notify_batch(pending)
     
     def register(self, observer):
-        self._observers.add(observer)
-        observer._subject = self
+        with self._observers_lock:
+            if not self._is_registered(observer):
+                self._observers = self._observers + (weakref.ref(observer, self._prune_callback),)
+                update_ref = weakref.WeakMethod(observer.update)
+                if inspect.iscoroutinefunction(observer.update):
+                    self._async_callables = self._async_callables + (update_ref,)
+                else:
+                    self._cached_callables = self._cached_callables + (update_ref,)
+                observer._subjects = observer._subjects + (weakref.ref(self),)
     
     def de_register(self, observer):
-        self._observers.discard(observer)
-        observer._subject = None
+        with self._observers_lock:
+            if not self._is_registered(observer):
+                return
+            self._drop(lambda o: o is observer)
+            observer._subjects = tuple(r for r in observer._subjects if r() is not self)
+    
+    def _is_registered(self, observer):
+        return any(ref() is observer for ref in self._observers)
+    
+    def _prune(self):
+        with self._observers_lock:
+            self._drop(lambda o: o is None)
+    
+    def _drop(self, should_drop):
+        """
+        Rebuild the observer tuples without the observers matching should_drop,
+        which is called with the live observer, or None for a collected one.
+        """
+        def bound_self(update_ref):
+            update = update_ref()
+            return None if update is None else update.__self__
+        
+        self._observers = tuple(r for r in self._observers if not should_drop(r()))
+        self._cached_callables = tuple(
+            r for r in self._cached_callables if not should_drop(bound_self(r)))
+        self._async_callables = tuple(
+            r for r in self._async_callables if not should_drop(bound_self(r)))
+    
+    def _is_unchanged(self, arg):
+        if arg is self._subject_state:
+            return True
+        try:
+            return bool(arg == self._subject_state)
+        except Exception:
+            # values that cannot be compared are treated as a change
+            return False
     
     @property
     def subject_state(self):
+        """
+        Push mode: assigning a new value hands it to every observer via update(arg),
+        so observers should not read subject.subject_state back from their update.
+        Observers that still pull use Observer.subject_state_snapshot.
+        
+        With async observers registered, assign it from a running event loop; otherwise
+        the assignment raises before the state changes. A value an async observer fails
+        to handle is reported to the loop's exception handler and is not delivered again.
+        """
         return self._subject_state
     
     @subject_state.setter
     def subject_state(self, arg):
+        # only a genuine change is broadcast, so observers pushing the same value back
+        # cannot start an endless notification loop
+        if self._is_unchanged(arg):
+            return
+        self._check_async_loop()
         self._subject_state = arg
+        pending = getattr(self._batch, 'pending', None)
+        if pending is not None:
+            pending.append(arg)
+            return
         self._notify(arg)
 
 
-class Observer(metaclass=abc.ABCMeta):
+class Observer:
     """
     Define an updating interface for objects that should be notified of
     changes in a subject.
     """
+    __slots__ = ('_observer_state', '_subjects', '__weakref__')
+    
     def __init__(self):
         self._observer_state = None
-        self._subject = None
+        # weak references to the subjects this observer is registered with
+        self._subjects = ()
     
-    @abc.abstractmethod
     def update(self, args):
-        pass
+        """
+        Receive either a single new state or, after a batch, the list of
+        states buffered by the subject.
+        """
+        raise NotImplementedError
+    
+    @property
+    def subject_state_snapshot(self):
+        """
+        Value delivered by the notification currently running, read without going
+        back through the subject. Works in sync and async update(); None outside one.
+        """
+        return _SNAPSHOT.get()
 
 
 class ConcreteObserver(Observer):
@@ -98,11 +315,35 @@ class ConcreteObserver(Observer):
     consistent with the subject's.
     Store state that should stay consistent with the subject's.
     """
+    __slots__ = ()
+    
     def push(self, arg):
-        self._subject.subject_state = arg
+        if not self._subjects:
+            raise RuntimeError("observer is not registered with a subject")
+        subjects = [s for s in (ref() for ref in self._subjects) if s is not None]
+        if not subjects:
+            raise RuntimeError("the subjects this observer registered with no longer exist")
+        current = getattr(_CURRENT_SUBJECT, 'value', None)
+        if any(s is current for s in subjects):
+            subject = current
+        else:
+            subject = subjects[-1]
+        subject.subject_state = arg
         
     def update(self, arg):
         self._observer_state = arg
+
+
+class AsyncConcreteObserver(Observer):
+    """
+    Observer whose update does I/O. Declaring it ``async def`` lets the subject
+    await all such observers concurrently instead of one after another.
+    Subjects with such observers must be updated from a running event loop.
+    """
+    __slots__ = ()
+    
+    async def update(self, arg):
+        self._observer_state = arg
         
 
 subject = Subject()
@@ -127,6 +368,68 @@ assert subject.subject_state == 'hello1'
 
 # de-registering
 subject.de_register(concrete_observer2)
+subject.de_register(concrete_observer2)  # no-op: already de-registered
 subject.subject_state = 'hello2'
 assert concrete_observer1._observer_state == 'hello2'
-assert concrete_observer2._subject is None
+assert concrete_observer2._observer_state == 'hello1'
+
+# an observer registered with several subjects pushes to one it is still registered with
+other_subject = Subject()
+other_subject.register(concrete_observer1)
+other_subject.de_register(concrete_observer1)
+concrete_observer1.push('hello2')
+assert other_subject.subject_state is None
+
+# observers are held weakly: one dropped without de-registering is pruned
+dropped_observer = ConcreteObserver()
+subject.register(dropped_observer)
+del dropped_observer
+assert len(subject._observers) == 1
+
+# batching: observers get one notification with every value set inside the block
+with subject.batch():
+    subject.subject_state = 'hello3'
+    subject.subject_state = 'hello4'
+assert concrete_observer1._observer_state == ['hello3', 'hello4']
+assert subject.subject_state == 'hello4'
+
+# a batch that raises is discarded: no notification and the state is rolled back
+try:
+    with subject.batch():
+        subject.subject_state = 'discarded'
+        raise ValueError
+except ValueError:
+    pass
+assert concrete_observer1._observer_state == ['hello3', 'hello4']
+assert subject.subject_state == 'hello4'
+
+# only the failing inner block is discarded; the enclosing batch still flushes its values
+with subject.batch():
+    subject.subject_state = 'kept'
+    try:
+        with subject.batch():
+            subject.subject_state = 'bad'
+            raise ValueError
+    except ValueError:
+        pass
+assert concrete_observer1._observer_state == ['kept']
+assert subject.subject_state == 'kept'
+
+# assigning the current value again does not notify the observers
+concrete_observer1._observer_state = None
+subject.subject_state = 'kept'
+assert concrete_observer1._observer_state is None
+
+# async observers are awaited concurrently, from a running event loop
+async def notify_async_observer():
+    subject.subject_state = 'hello5'
+    assert concrete_observer1._observer_state == 'hello5'
+    await subject.wait_async()
+
+async_observer = AsyncConcreteObserver()
+subject.register(async_observer)
+asyncio.run(notify_async_observer())
+assert async_observer._observer_state == 'hello5'
+
+# the snapshot only carries a value while a notification is being delivered
+assert concrete_observer1.subject_state_snapshot is None
@@ -54,49 +54,76 @@ a "flex point".
 4. Clients of the algorithm couple themselves to the interface.
 """
 
-import abc
+import functools
 
 
-class Strategy(metaclass=abc.ABCMeta):
+class Strategy:
     """
-    Declare an interface common to all supported algorithms. Context uses this interface
-    to call the algorithm defined by a ConcreteStrategy.
+    Tag common to all supported algorithms. The algorithm of each ConcreteStrategy is
+    registered on algorithm_interface, which Context uses to call it.
     """
-    @abc.abstractmethod
-    def algorithm_interface(self):
-        pass
+    __slots__ = ()
+    
+    def __new__(cls):
+        # Stateless, so every client can share one instance per class. Read the cache
+        # from the class's own __dict__ so a subclass never gets its parent's instance.
+        instance = cls.__dict__.get('_instance')
+        if instance is None:
+            instance = super().__new__(cls)
+            cls._instance = instance
+        return instance
 
 
 class ConcreteStrategyA(Strategy):
     """
-       Implement the algorithm using the Strategy interface.
+       Select algorithm A.
     """
-    
-    def algorithm_interface(self):
-        return "Algorithm A is implemented"
+    __slots__ = ()
 
 
 class ConcreteStrategyB(Strategy):
     """
-        Implement the algorithm using the Strategy interface.
+        Select algorithm B.
     """
-    
-    def algorithm_interface(self):
-        return "Algorithm B is implemented"
+    __slots__ = ()
+
+
+@functools.singledispatch
+def algorithm_interface(strategy):
+    """
+    Declare an interface common to all supported algorithms. Each ConcreteStrategy
+    registers its implementation of the algorithm.
+    """
+    raise NotImplementedError
+
+
+@algorithm_interface.register(ConcreteStrategyA)
+def _(strategy):
+    return "Algorithm A is implemented"
+
+
+@algorithm_interface.register(ConcreteStrategyB)
+def _(strategy):
+    return "Algorithm B is implemented"
 
 
 class Context:
     """
     Define the interface of interest to clients. Maintain a reference to a Strategy object.
     """
+    __slots__ = ('_strategy', 'client_interface_to_call_algo')
+    
     def __init__(self, strategy):
         self._strategy = strategy
-        
-    def client_interface_to_call_algo(self):
-        return self._strategy.algorithm_interface()
+        # The strategy is fixed for the lifetime of the context, so its algorithm is
+        # looked up once here and clients call it directly.
+        self.client_interface_to_call_algo = functools.partial(
+            algorithm_interface.dispatch(type(strategy)), strategy)
     
 
 # This is how Client uses the context interface, he has a say which algo he wants to use
 concreate_strategy_a = ConcreteStrategyA()
 context = Context(strategy=concreate_strategy_a)
 assert "Algorithm A is implemented" == context.client_interface_to_call_algo()
+assert ConcreteStrategyA() is concreate_strategy_a
+assert "Algorithm B is implemented" == algorithm_interface(ConcreteStrategyB())
@@ -25,29 +25,33 @@ Singleton should be considered only if all three of the following criteria are s
 The Singleton pattern can be extended to support access to an application-specific number of
 instances.
 """
+import sys
 import threading
 
 
 class Singleton:
-    __singleton_lock = threading.Lock()
-    __app_instance = None
-    
     def __init__(self):
         pass
-    
-    @classmethod
-    def get_cls_instance(cls):
-        if not cls.__app_instance:
-            cls.__singleton_lock.acquire()
-            if not cls.__app_instance:
-                cls.__app_instance = Singleton()
-            cls.__singleton_lock.release()
-
-        return cls.__app_instance
-
-
-# If you want to get an instance of Singleton class, do not call the class directly but instead
-# ALWAYS call the class method that takes care of creation of Singleton object.
-s1 = Singleton.get_cls_instance()
-s2 = Singleton.get_cls_instance()
-assert s1 == s2
+
+
+# Only taken on the first access to the module attribute ``singleton``; afterwards the
+# instance lives in the module globals and __getattr__ is never called again.
+_singleton_lock = threading.Lock()
+
+
+def __getattr__(name):
+    if name != 'singleton':
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    with _singleton_lock:
+        if 'singleton' not in globals():
+            globals()['singleton'] = Singleton()
+    return globals()['singleton']
+
+
+# If you want to get the instance of Singleton class, do not call the class directly but instead
+# ALWAYS import it from the module: ``from creational.Singleton import singleton``.
+# It is created lazily on first access.
+module = sys.modules[__name__]
+s1 = module.singleton
+s2 = module.singleton
+assert s1 is s2
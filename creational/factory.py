@@ -33,54 +33,39 @@ The advantage of a Factory Method is that it can return the same instance multip
 return a subclass rather than an object of that exact type.
 """
 
-import abc
 
-# it is important to write metaclass here
-
-
-class Creator(metaclass=abc.ABCMeta):
+class Creator:
     """
-    Declare the factory method, which returns an object of type Product.
-    Creator may also define a default implementation of the factory
-    method that returns a default ConcreteProduct object.
-    Call the factory method to create a Product object.
+    Create the Product registered under product_key in _FACTORY_TABLE.
+    The table replaces one ConcreteCreator subclass per product: adding a
+    product only needs a new table entry.
     """
-    def __init__(self):
-        self.product = self._factory_method()
+    __slots__ = ('product',)
     
-    @abc.abstractmethod
-    def _factory_method(self):
-        pass
+    def __init__(self, product_key):
+        self.product = _FACTORY_TABLE[product_key]()
     
     def client_uses_this_api_to_call_product_function(self):
         return self.product.interface()
 
 
-class ConcreteCreatorA(Creator):
-    """
-    Override the factory method to return an instance of a
-    ConcreteProduct1.
-    """
-    def _factory_method(self):
-        return ConcreteProductA()
-
-
-class ConcreteCreatorB(Creator):
-    """
-    Override the factory method to return an instance of a
-    ConcreteProduct2.
-    """
-    def _factory_method(self):
-        return ConcreteProductB()
-
-
-class Product(metaclass=abc.ABCMeta):
+class Product:
     """
     Define the interface of objects the factory method creates.
     """
-    @abc.abstractmethod
+    __slots__ = ()
+    
+    def __new__(cls):
+        # Products hold no state, so each class hands out the same instance every time.
+        # The cache is looked up in cls.__dict__, never inherited from a parent class.
+        instance = cls.__dict__.get('_instance')
+        if instance is None:
+            instance = super().__new__(cls)
+            cls._instance = instance
+        return instance
+    
     def interface(self):
-        pass
+        raise NotImplementedError
 
     def common_function(self):
         return "Product: common function"
@@ -90,6 +75,8 @@ class ConcreteProductA(Product):
     """
     Implement the Product interface.
     """
+    __slots__ = ()
+    
     def interface(self):
         return "Concrete Product A"
 
@@ -98,19 +85,30 @@ class ConcreteProductB(Product):
     """
     Implement the Product interface.
     """
+    __slots__ = ()
+    
     def interface(self):
         return "Concrete Product B"
 
 
+_FACTORY_TABLE = {
+    'A': ConcreteProductA,
+    'B': ConcreteProductB,
+}
+
+
 # This is how Client uses the context interface, he does not initiate the product but let
 # application decide which subclass to initiate.
 
 # Example 1
-concrete_creator = ConcreteCreatorA()
+concrete_creator = Creator('A')
 assert "Concrete Product A" == concrete_creator.client_uses_this_api_to_call_product_function()
 assert "Product: common function" == concrete_creator.product.common_function()
 
+# Products are stateless, so creators share a single instance per product
+assert Creator('A').product is concrete_creator.product
+
 # Example 2
-concrete_creator = ConcreteCreatorB()
+concrete_creator = Creator('B')
 assert "Concrete Product B" == concrete_creator.client_uses_this_api_to_call_product_function()
 assert "Product: common function" == concrete_creator.product.common_function()